@@ -0,0 +1,16 @@
+"""
+Gunicorn config for the signer service.
+
+Run with:  gunicorn main:app
+
+gevent workers let one process serve many /execute calls concurrently
+while each waits on ProofGate and the RPC node. Keep a single worker:
+the service owns the nonce counter for its signing key.
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 3000)}"
+worker_class = "gevent"
+workers = 1
+worker_connections = 500
@@ -17,11 +17,26 @@ Architecture:
                         └──────────────┘
 """
 
+import atexit
+import functools
+import logging
+import logging.handlers
 import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import coincurve
+import orjson
 from flask import Flask, request, jsonify
+from flask.json.provider import JSONProvider
+from pydantic import BaseModel, ValidationError
 from web3 import Web3
 from eth_account import Account
-from proofgate import ProofGate
+from eth_account._utils.legacy_transactions import (
+    encode_transaction,
+    serializable_unsigned_transaction_from_dict,
+)
+from proofgate import ProofGate, ValidateRequest
 
 # ============================================
 # CONFIGURATION
@@ -31,6 +46,11 @@ PORT = int(os.environ.get("PORT", 3000))
 PRIVATE_KEY = os.environ.get("PRIVATE_KEY")
 PROOFGATE_API_KEY = os.environ.get("PROOFGATE_API_KEY")
 RPC_URL = os.environ.get("RPC_URL", "https://mainnet.base.org")
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO")  # set WARNING in production
+CHAIN_ID = 8453  # Base
+
+# EIP-155 signature v offset for CHAIN_ID (v = V_BASE + recovery id)
+V_BASE = 2 * CHAIN_ID + 35
 
 if not PRIVATE_KEY:
     raise ValueError("PRIVATE_KEY environment variable required")
@@ -42,14 +62,156 @@ if not PROOFGATE_API_KEY:
 # SETUP
 # ============================================
 
+# Log through a queue: request handlers only enqueue records and a
+# background listener thread does the actual writes to stderr.
+log_queue = queue.SimpleQueue()
+log_listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler())
+log_listener.start()
+atexit.register(log_listener.stop)
+logging.basicConfig(level=LOG_LEVEL, handlers=[logging.handlers.QueueHandler(log_queue)])
+log = logging.getLogger("signer")
+
 # Initialize ProofGate client
-proofgate = ProofGate(api_key=PROOFGATE_API_KEY, chain_id=8453)
+proofgate = ProofGate(api_key=PROOFGATE_API_KEY, chain_id=CHAIN_ID)
 
 # Initialize Web3 and account (private key ONLY here, not in LLM)
 w3 = Web3(Web3.HTTPProvider(RPC_URL))
 account = Account.from_key(PRIVATE_KEY)
+ACCOUNT_ADDRESS = account.address
+
+# Native libsecp256k1 key, used for signing instead of the pure-Python path
+signing_key = coincurve.PrivateKey(bytes(account.key))
+
+# Local nonce counter, seeded once from the node and bumped per transaction
+nonce_lock = threading.Lock()
+current_nonce = w3.eth.get_transaction_count(ACCOUNT_ADDRESS, "pending")
+
+# Runs RPC reads that don't depend on validation alongside the ProofGate call
+io_pool = ThreadPoolExecutor(max_workers=8)
+
+# Warm up the ProofGate connection (DNS + TLS) so the first /execute doesn't
+# pay for it. The nonce lookup above already did the same for the RPC node.
+try:
+    proofgate.check_agent(ACCOUNT_ADDRESS)
+except Exception as e:
+    log.warning("ProofGate warmup failed: %s", e)
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    Flask JSON provider backed by orjson. ProofGate models (e.g. validation
+    checks) are serialized through model_dump().
+    """
+
+    @staticmethod
+    def _default(obj):
+        if isinstance(obj, BaseModel):
+            return obj.model_dump()
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self._default).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+
+# ============================================
+# HELPERS
+# ============================================
+
+@functools.lru_cache(maxsize=4096)
+def checksum_address(address):
+    """
+    Checksums an address, caching results since agents tend to
+    target the same handful of contracts over and over.
+    """
+    return Web3.to_checksum_address(address)
+
+
+def reserve_nonce(count=1):
+    """
+    Hands out the next nonce (or a run of `count` consecutive nonces,
+    returning the first) from the local counter, so concurrent requests
+    never race on eth_getTransactionCount.
+    """
+    global current_nonce
+    with nonce_lock:
+        nonce = current_nonce
+        current_nonce += count
+    return nonce
+
+
+def resync_nonce():
+    """
+    Re-reads the pending nonce from the node after a failed send,
+    so a dropped transaction does not leave a gap in the sequence.
+    """
+    global current_nonce
+    with nonce_lock:
+        current_nonce = w3.eth.get_transaction_count(ACCOUNT_ADDRESS, "pending")
+
+
+def sign_transaction(tx):
+    """
+    Signs a legacy (EIP-155) transaction for CHAIN_ID with libsecp256k1
+    via coincurve and returns the raw bytes ready for eth_sendRawTransaction.
+    """
+    unsigned = serializable_unsigned_transaction_from_dict(tx)
+    sig = signing_key.sign_recoverable(unsigned.hash(), hasher=None)
+    v = V_BASE + sig[64]
+    r = int.from_bytes(sig[0:32], "big")
+    s = int.from_bytes(sig[32:64], "big")
+    return encode_transaction(unsigned, vrs=(v, r, s))
+
+
+def sign_many(txs):
+    """
+    Signs several transactions with the shared coincurve key,
+    returning the raw transactions in the same order.
+    """
+    return list(io_pool.map(sign_transaction, txs))
+
+
+# What checksum_address / to_wei raise for a malformed address or value
+BAD_TX_INPUT = (ValueError, TypeError, ArithmeticError)
+
+
+def build_transaction(to_address, tx_data, value, gas_price):
+    """
+    Builds the legacy transaction dict for CHAIN_ID, without a nonce.
+    Raises one of BAD_TX_INPUT on a bad address or value, before any
+    nonce has been reserved for it.
+    """
+    return {
+        "to": checksum_address(to_address),
+        "data": tx_data,
+        "value": w3.to_wei(value, "ether") if value != "0" else 0,
+        "gas": 200000,
+        "gasPrice": gas_price,
+        "chainId": CHAIN_ID,
+    }
+
+
+def read_json_object():
+    """
+    Decodes the request body as a JSON object.
+    Returns None if the body is not valid JSON or not an object.
+    """
+    try:
+        data = orjson.loads(request.get_data())
+    except orjson.JSONDecodeError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def bad_request(error):
+    """Returns a 400 response in the service's error shape."""
+    return jsonify({"success": False, "error": error}), 400
+
 
 # ============================================
 # ENDPOINTS
@@ -61,83 +223,185 @@ def execute():
     Receives a transaction request from the LLM,
     validates it via ProofGate, and executes if safe.
     """
-    data = request.json
-    to_address = data.get("to")
-    tx_data = data.get("data", "0x")
-    value = data.get("value", "0")
-    guardrail_id = data.get("guardrailId")
+    data = read_json_object()
+    if data is None:
+        return bad_request("Request body must be a JSON object")
+    get = data.get
+    to_address = get("to")
+    tx_data = get("data", "0x")
+    value = get("value", "0")
+    guardrail_id = get("guardrailId")
+    eth = w3.eth
 
-    print(f"Transaction request received")
-    print(f"  To: {to_address}")
-    print(f"  Value: {value}")
-    print(f"  Data: {tx_data[:20]}...")
+    log.info("Transaction request: to=%s value=%s data=%.20s...", to_address, value, tx_data)
 
     try:
         # ========================================
         # STEP 1: Validate with ProofGate
         # ========================================
-        print("  → Validating with ProofGate...")
-        
+        log.debug("Validating with ProofGate...")
+
+        # Fetch gas price in parallel; it's only used if validation passes
+        gas_price_future = io_pool.submit(lambda: eth.gas_price)
+
         validation = proofgate.validate(
-            from_address=account.address,
+            from_address=ACCOUNT_ADDRESS,
             to=to_address,
             data=tx_data,
             value=value,
             guardrail_id=guardrail_id,
         )
 
-        print(f"  → Validation result: {validation.result}")
+        result = validation.result
+        reason = validation.reason
+        summary = {"result": result, "reason": reason, "checks": validation.checks}
+
+        log.info("Validation result: %s", result)
 
         # ========================================
         # STEP 2: Reject if unsafe
         # ========================================
         if not validation.safe:
-            print(f"  ✗ Transaction BLOCKED: {validation.reason}")
+            log.warning("Transaction BLOCKED: %s", reason)
+            gas_price_future.cancel()
             return jsonify({
                 "success": False,
-                "error": f"Transaction blocked by ProofGate: {validation.reason}",
-                "validation": {
-                    "result": validation.result,
-                    "reason": validation.reason,
-                    "checks": validation.checks,
-                },
+                "error": f"Transaction blocked by ProofGate: {reason}",
+                "validation": summary,
             }), 400
 
         # ========================================
         # STEP 3: Sign and execute if safe
         # ========================================
-        print("  → Transaction validated, signing and executing...")
-
-        # Build transaction
-        tx = {
-            "to": Web3.to_checksum_address(to_address),
-            "data": tx_data,
-            "value": w3.to_wei(value, "ether") if value != "0" else 0,
-            "gas": 200000,
-            "gasPrice": w3.eth.gas_price,
-            "nonce": w3.eth.get_transaction_count(account.address),
-            "chainId": 8453,
-        }
-
-        # Sign and send
-        signed_tx = account.sign_transaction(tx)
-        tx_hash = w3.eth.send_raw_transaction(signed_tx.rawTransaction)
+        log.debug("Transaction validated, signing and executing...")
+
+        # Build transaction; bad input is rejected before a nonce is taken
+        try:
+            tx = build_transaction(to_address, tx_data, value, gas_price_future.result())
+        except BAD_TX_INPUT as e:
+            return bad_request(f"Invalid transaction: {e}")
+
+        tx["nonce"] = reserve_nonce()
+        try:
+            # Sign and send
+            raw_tx = sign_transaction(tx)
+            tx_hash = eth.send_raw_transaction(raw_tx)
+        except Exception:
+            resync_nonce()
+            raise
+
         tx_hash_hex = tx_hash.hex()
 
-        print(f"  ✓ Transaction sent: {tx_hash_hex}")
+        log.info("Transaction sent: %s", tx_hash_hex)
 
         return jsonify({
             "success": True,
             "txHash": tx_hash_hex,
-            "validation": {
-                "result": validation.result,
-                "reason": validation.reason,
-                "checks": validation.checks,
-            },
+            "validation": summary,
+        })
+
+    except Exception as e:
+        log.error("Transaction failed: %s", e)
+        return jsonify({
+            "success": False,
+            "error": str(e),
+        }), 500
+
+
+@app.route("/execute-batch", methods=["POST"])
+def execute_batch():
+    """
+    Receives a list of transactions from the LLM, validates them all
+    concurrently via ProofGate, and executes them (in order) only if
+    every one is safe.
+    """
+    data = read_json_object()
+    items = data.get("transactions", []) if data is not None else None
+    if not isinstance(items, list) or not items or not all(isinstance(i, dict) for i in items):
+        return bad_request(
+            "Request body must be a JSON object with a non-empty list of transactions"
+        )
+
+    batch = []
+    for i, item in enumerate(items):
+        try:
+            batch.append(ValidateRequest(
+                from_address=ACCOUNT_ADDRESS,
+                to=item.get("to"),
+                data=item.get("data", "0x"),
+                value=item.get("value", "0"),
+                guardrail_id=item.get("guardrailId"),
+            ))
+        except ValidationError as e:
+            error = e.errors()[0]
+            field = ".".join(str(part) for part in error["loc"])
+            return bad_request(f"Invalid transaction {i}: {field}: {error['msg']}")
+
+    log.info("Batch request: %d transactions", len(items))
+
+    try:
+        gas_price_future = io_pool.submit(lambda: w3.eth.gas_price)
+
+        validations = proofgate.validate_many(batch)
+        summaries = [
+            {"result": v.result, "reason": v.reason, "checks": v.checks}
+            for v in validations
+        ]
+
+        blocked = [i for i, v in enumerate(validations) if not v.safe]
+        if blocked:
+            log.warning("Batch BLOCKED: transactions %s", blocked)
+            gas_price_future.cancel()
+            return jsonify({
+                "success": False,
+                "error": f"Transactions blocked by ProofGate: {blocked}",
+                "validations": summaries,
+            }), 400
+
+        gas_price = gas_price_future.result()
+        try:
+            txs = [
+                build_transaction(
+                    item.get("to"),
+                    item.get("data", "0x"),
+                    item.get("value", "0"),
+                    gas_price,
+                )
+                for item in items
+            ]
+        except BAD_TX_INPUT as e:
+            return bad_request(f"Invalid transaction: {e}")
+
+        first_nonce = reserve_nonce(len(txs))
+        for i, tx in enumerate(txs):
+            tx["nonce"] = first_nonce + i
+        tx_hashes = []
+        try:
+            for raw_tx in sign_many(txs):
+                tx_hashes.append(w3.eth.send_raw_transaction(raw_tx).hex())
+        except Exception as e:
+            resync_nonce()
+            log.error("Batch failed after %d of %d sent: %s", len(tx_hashes), len(txs), e)
+            # Sent transactions can't be recalled; report them so a retry
+            # only resends the ones that didn't go out
+            return jsonify({
+                "success": False,
+                "error": str(e),
+                "txHashes": tx_hashes,
+                "failedIndex": len(tx_hashes),
+                "validations": summaries,
+            }), 500
+
+        log.info("Batch sent: %s", tx_hashes)
+
+        return jsonify({
+            "success": True,
+            "txHashes": tx_hashes,
+            "validations": summaries,
         })
 
     except Exception as e:
-        print(f"  ✗ Error: {str(e)}")
+        log.error("Batch failed: %s", e)
         return jsonify({
             "success": False,
             "error": str(e),
@@ -150,7 +414,7 @@ def get_address():
     Returns the wallet address (so LLM can use it in transactions).
     Does NOT expose the private key.
     """
-    return jsonify({"address": account.address})
+    return jsonify({"address": ACCOUNT_ADDRESS})
 
 
 @app.route("/health", methods=["GET"])
@@ -158,7 +422,7 @@ def health():
     """Health check."""
     return jsonify({
         "status": "healthy",
-        "address": account.address,
+        "address": ACCOUNT_ADDRESS,
         "chain": "base",
     })
 
@@ -168,10 +432,11 @@ def health():
 # ============================================
 
 if __name__ == "__main__":
-    print(f"\n🔐 ProofGate Signer Service (Python)")
-    print(f"   Wallet: {account.address}")
-    print(f"   Chain:  Base (8453)")
+    print("\n🔐 ProofGate Signer Service (Python)")
+    print(f"   Wallet: {ACCOUNT_ADDRESS}")
+    print(f"   Chain:  Base ({CHAIN_ID})")
     print(f"   Port:   {PORT}")
-    print(f"\n   The LLM can call /execute without ever seeing the private key.\n")
+    print("\n   The LLM can call /execute without ever seeing the private key.")
+    print("   (Development server; use `gunicorn main:app` in production.)\n")
     
     app.run(host="0.0.0.0", port=PORT)
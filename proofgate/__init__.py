@@ -23,7 +23,7 @@ Example:
     ...     print(f"Blocked: {result.reason}")
 """
 
-from proofgate.client import ProofGate, AsyncProofGate
+from proofgate.client import ProofGate, AsyncProofGate, is_transaction_safe
 from proofgate.types import (
     ProofGateConfig,
     ValidateRequest,
@@ -38,6 +38,7 @@ from proofgate.exceptions import ProofGateError
 __all__ = [
     "ProofGate",
     "AsyncProofGate",
+    "is_transaction_safe",
     "ProofGateConfig",
     "ValidateRequest",
     "ValidateResponse",
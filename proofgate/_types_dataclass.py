@@ -0,0 +1,96 @@
+"""Dependency-free fallback for :mod:`proofgate.types_fast`.
+
+Used when msgspec is not installed. ``/validate`` responses are decoded
+with orjson and copied into frozen dataclasses without type checks; the
+other fast parsers need msgspec.
+"""
+
+import sys
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, FrozenSet, List
+
+import orjson
+
+from proofgate.types import Severity, ValidationStatus
+
+# slots= is only accepted by dataclass() on Python 3.10+
+_DATACLASS_OPTIONS: Dict[str, Any] = {"frozen": True}
+if sys.version_info >= (3, 10):
+    _DATACLASS_OPTIONS["slots"] = True
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class ValidationCheckFast:
+    """Individual check result from validation."""
+    
+    name: str
+    passed: bool
+    details: str
+    severity: Severity
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class ValidateResponseFast:
+    """Response from transaction validation."""
+    
+    validation_id: str
+    result: ValidationStatus
+    reason: str
+    evidence_uri: str
+    safe: bool
+    chain_id: int
+    checks: List[ValidationCheckFast] = field(default_factory=list)
+    authenticated: bool = False
+    tier: str = "free"
+    backend: str = "local"
+    on_chain_recorded: bool = False
+
+
+# camelCase wire keys that differ from their field names
+_VALIDATE_KEYS = {
+    "validationId": "validation_id",
+    "evidenceUri": "evidence_uri",
+    "chainId": "chain_id",
+    "onChainRecorded": "on_chain_recorded",
+}
+_VALIDATE_FIELDS = frozenset(f.name for f in fields(ValidateResponseFast))
+_CHECK_FIELDS = frozenset(f.name for f in fields(ValidationCheckFast))
+
+
+def _pick(
+    data: Dict[str, Any],
+    names: FrozenSet[str],
+    keys: Dict[str, str],
+) -> Dict[str, Any]:
+    """Map wire keys to field names, dropping keys with no matching field."""
+    values = {}
+    for key, value in data.items():
+        name = keys.get(key, key)
+        if name in names:
+            values[name] = value
+    return values
+
+
+def parse_validate_fast(raw: bytes) -> ValidateResponseFast:
+    """Decode a JSON /validate response."""
+    values = _pick(orjson.loads(raw), _VALIDATE_FIELDS, _VALIDATE_KEYS)
+    values["checks"] = [
+        ValidationCheckFast(**_pick(c, _CHECK_FIELDS, {})) for c in values.get("checks", ())
+    ]
+    return ValidateResponseFast(**values)
+
+
+def parse_agent_check_fast(raw: bytes) -> Any:
+    """Unavailable without msgspec."""
+    raise ImportError(
+        "Fast agent check parsing requires msgspec. "
+        'Install it with: pip install "proofgate[performance]"'
+    )
+
+
+def parse_evidence_fast(raw: bytes) -> Any:
+    """Unavailable without msgspec."""
+    raise ImportError(
+        "Fast evidence parsing requires msgspec. "
+        'Install it with: pip install "proofgate[performance]"'
+    )
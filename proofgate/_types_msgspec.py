@@ -0,0 +1,135 @@
+"""msgspec implementation of :mod:`proofgate.types_fast`.
+
+These structs decode API responses in a single C-level pass, with type
+checks. Import them from ``proofgate.types_fast``.
+"""
+
+from typing import Any, List, Optional
+
+import msgspec
+
+from proofgate.types import Severity, TrustTier, ValidationStatus, VerificationStatus
+
+
+class ValidationCheckFast(msgspec.Struct, frozen=True):
+    """Individual check result from validation."""
+    
+    name: str
+    passed: bool
+    details: str
+    severity: Severity
+
+
+class ValidateResponseFast(msgspec.Struct, rename="camel", frozen=True):
+    """Response from transaction validation."""
+    
+    validation_id: str
+    result: ValidationStatus
+    reason: str
+    evidence_uri: str
+    safe: bool
+    chain_id: int
+    checks: List[ValidationCheckFast] = []
+    authenticated: bool = False
+    tier: str = "free"
+    backend: str = "local"
+    on_chain_recorded: bool = False
+
+
+class AgentStatsFast(msgspec.Struct, rename="camel", frozen=True):
+    """Validation statistics for an agent."""
+    
+    total_validations: int
+    passed_validations: int
+    failed_validations: int
+    pass_rate: float
+
+
+class AgentRegistrationFast(msgspec.Struct, rename="camel", frozen=True):
+    """Registration info for an agent."""
+    
+    registered_at: str
+    name: Any = None
+
+
+class AgentCheckResponseFast(msgspec.Struct, rename="camel", frozen=True):
+    """Response from agent check."""
+    
+    wallet: str
+    is_registered: bool
+    verification_status: VerificationStatus
+    verification_message: str
+    trust_score: int
+    tier: TrustTier
+    tier_emoji: str
+    tier_name: str
+    stats: AgentStatsFast
+    recommendation: str
+    registration: Optional[AgentRegistrationFast] = None
+
+
+class EvidenceTransactionFast(msgspec.Struct, rename={"from_address": "from"}, frozen=True):
+    """Transaction details in evidence."""
+    
+    from_address: str
+    to: str
+    data: str
+    value: str
+
+
+class EvidenceResultFast(msgspec.Struct, frozen=True):
+    """Validation result in evidence."""
+    
+    status: ValidationStatus
+    reason: str
+    safe: bool
+
+
+class EvidenceAgentFast(msgspec.Struct, frozen=True):
+    """Agent info in evidence."""
+    
+    wallet: str
+    verified: bool
+    name: Optional[str] = None
+
+
+class EvidenceProofFast(msgspec.Struct, rename="camel", frozen=True):
+    """Proof metadata in evidence."""
+    
+    authenticated: bool
+    on_chain_recorded: bool
+    batch_id: Any = None
+    recorded_at: Any = None
+
+
+class EvidenceResponseFast(msgspec.Struct, rename="camel", frozen=True):
+    """Response from evidence retrieval."""
+    
+    validation_id: str
+    timestamp: str
+    chain_id: int
+    transaction: EvidenceTransactionFast
+    result: EvidenceResultFast
+    agent: EvidenceAgentFast
+    proof: EvidenceProofFast
+    guardrail_id: Optional[str] = None
+
+
+_VALIDATE_DECODER = msgspec.json.Decoder(ValidateResponseFast)
+_AGENT_CHECK_DECODER = msgspec.json.Decoder(AgentCheckResponseFast)
+_EVIDENCE_DECODER = msgspec.json.Decoder(EvidenceResponseFast)
+
+
+def parse_validate_fast(raw: bytes) -> ValidateResponseFast:
+    """Decode a JSON /validate response."""
+    return _VALIDATE_DECODER.decode(raw)
+
+
+def parse_agent_check_fast(raw: bytes) -> AgentCheckResponseFast:
+    """Decode a JSON /agents/check response."""
+    return _AGENT_CHECK_DECODER.decode(raw)
+
+
+def parse_evidence_fast(raw: bytes) -> EvidenceResponseFast:
+    """Decode a JSON /evidence response."""
+    return _EVIDENCE_DECODER.decode(raw)
@@ -1,7 +1,17 @@
 """ProofGate SDK Client implementations."""
 
-from typing import Optional, Dict, Any
+import asyncio
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING, Any, Callable, Dict, List, Literal, Optional, Set, Tuple, Type, TypeVar,
+    Union, cast, overload,
+)
 import httpx
+import orjson
+from cachetools import TTLCache
+from pydantic import BaseModel
 
 from proofgate.types import (
     ProofGateConfig,
@@ -10,9 +20,61 @@ from proofgate.types import (
     AgentCheckResponse,
     EvidenceResponse,
     UsageResponse,
+    parse_agent_check_response,
+    parse_evidence_response,
+    parse_usage_response,
+    parse_validate_response,
 )
 from proofgate.exceptions import ProofGateError
 
+if TYPE_CHECKING:
+    from proofgate.types_fast import (
+        AgentCheckResponseFast,
+        EvidenceResponseFast,
+        ValidateResponseFast,
+    )
+
+M = TypeVar("M", bound=BaseModel)
+
+
+# API keys that already passed _check_api_key, so repeated client
+# construction with the same key skips the checks.
+_validated_keys: Set[str] = set()
+
+
+def _check_api_key(api_key: str) -> None:
+    """Raise ProofGateError if the API key is missing or malformed."""
+    if api_key in _validated_keys:
+        return
+    
+    if not api_key:
+        raise ProofGateError(
+            "API key is required. Get one at https://www.proofgate.xyz/dashboard",
+            "MISSING_API_KEY",
+        )
+    
+    if not api_key.startswith("pg_"):
+        raise ProofGateError(
+            'Invalid API key format. Keys start with "pg_"',
+            "INVALID_API_KEY",
+        )
+    
+    _validated_keys.add(api_key)
+
+
+# Single-pass JSON validators for each response model
+_PARSERS: Dict[Type[BaseModel], Callable[[bytes], BaseModel]] = {
+    ValidateResponse: parse_validate_response,
+    AgentCheckResponse: parse_agent_check_response,
+    EvidenceResponse: parse_evidence_response,
+    UsageResponse: parse_usage_response,
+}
+
+
+def _parse(model: Type[M], raw: bytes) -> M:
+    """Validate a raw API response into ``model`` in a single pass."""
+    return cast(M, _PARSERS[model](raw))
+
 
 class AsyncProofGate:
     """Async ProofGate SDK Client.
@@ -41,6 +103,8 @@ class AsyncProofGate:
         chain_id: int = 8453,
         guardrail_id: Optional[str] = None,
         timeout: float = 30.0,
+        pool_size: int = 100,
+        cache_ttl: float = 0.0,
     ):
         """Initialize ProofGate client.
         
@@ -50,18 +114,13 @@ class AsyncProofGate:
             chain_id: Default chain ID (default: 8453 for Base)
             guardrail_id: Default guardrail ID to use for validations
             timeout: Request timeout in seconds (default: 30.0)
+            pool_size: Max pooled connections; requests are multiplexed
+                over HTTP/2 (default: 100)
+            cache_ttl: Seconds to reuse validate() results for identical
+                transactions, e.g. agent retries (default: 0, disabled).
+                Cache hits skip server-side checks such as daily limits.
         """
-        if not api_key:
-            raise ProofGateError(
-                "API key is required. Get one at https://www.proofgate.xyz/dashboard",
-                "MISSING_API_KEY",
-            )
-        
-        if not api_key.startswith("pg_"):
-            raise ProofGateError(
-                'Invalid API key format. Keys start with "pg_"',
-                "INVALID_API_KEY",
-            )
+        _check_api_key(api_key)
         
         self.config = ProofGateConfig(
             api_key=api_key,
@@ -69,17 +128,29 @@ class AsyncProofGate:
             chain_id=chain_id,
             guardrail_id=guardrail_id,
             timeout=timeout,
+            pool_size=pool_size,
+            cache_ttl=cache_ttl,
         )
         
+        limits = httpx.Limits(
+            max_connections=pool_size,
+            max_keepalive_connections=pool_size,
+        )
         self._client = httpx.AsyncClient(
             base_url=base_url,
             timeout=timeout,
+            limits=limits,
+            http2=True,
             headers={
                 "Content-Type": "application/json",
                 "X-API-Key": api_key,
             },
         )
     
+        self._cache: "Optional[TTLCache[Tuple[Any, ...], ValidateResponse]]" = (
+            TTLCache(maxsize=1024, ttl=cache_ttl) if cache_ttl > 0 else None
+        )
+    
     async def __aenter__(self) -> "AsyncProofGate":
         return self
     
@@ -95,26 +166,67 @@ class AsyncProofGate:
         method: str,
         path: str,
         json: Optional[Dict[str, Any]] = None,
-    ) -> Dict[str, Any]:
-        """Make an API request."""
+    ) -> bytes:
+        """Make an API request and return the raw response body."""
         try:
-            response = await self._client.request(method, path, json=json)
-            data = response.json()
+            body = orjson.dumps(json) if json is not None else None
+            response = await self._client.request(method, path, content=body)
             
             if not response.is_success:
+                data = orjson.loads(response.content)
                 raise ProofGateError(
                     data.get("error") or data.get("message") or f"HTTP {response.status_code}",
                     "API_ERROR",
                     response.status_code,
                 )
             
-            return data
+            return response.content
             
         except httpx.TimeoutException:
             raise ProofGateError("Request timeout", "TIMEOUT")
         except httpx.RequestError as e:
             raise ProofGateError(str(e), "NETWORK_ERROR")
     
+    @overload
+    async def validate(
+        self,
+        from_address: str,
+        to: str,
+        data: str,
+        value: str = ...,
+        guardrail_id: Optional[str] = ...,
+        chain_id: Optional[int] = ...,
+        cache: bool = ...,
+        raw: Literal[False] = ...,
+    ) -> ValidateResponse: ...
+    
+    @overload
+    async def validate(
+        self,
+        from_address: str,
+        to: str,
+        data: str,
+        value: str = ...,
+        guardrail_id: Optional[str] = ...,
+        chain_id: Optional[int] = ...,
+        cache: bool = ...,
+        *,
+        raw: Literal[True],
+    ) -> "ValidateResponseFast": ...
+    
+    @overload
+    async def validate(
+        self,
+        from_address: str,
+        to: str,
+        data: str,
+        value: str = ...,
+        guardrail_id: Optional[str] = ...,
+        chain_id: Optional[int] = ...,
+        cache: bool = ...,
+        raw: bool = ...,
+    ) -> Union[ValidateResponse, "ValidateResponseFast"]: ...
+    
     async def validate(
         self,
         from_address: str,
@@ -123,7 +235,9 @@ class AsyncProofGate:
         value: str = "0",
         guardrail_id: Optional[str] = None,
         chain_id: Optional[int] = None,
-    ) -> ValidateResponse:
+        cache: bool = True,
+        raw: bool = False,
+    ) -> Union[ValidateResponse, "ValidateResponseFast"]:
         """Validate a transaction before execution.
         
         Args:
@@ -133,6 +247,9 @@ class AsyncProofGate:
             value: Value in wei (default: "0")
             guardrail_id: Guardrail ID (overrides default)
             chain_id: Chain ID (overrides default)
+            cache: Use the result cache, if enabled via cache_ttl (default: True)
+            raw: Return a ``ValidateResponseFast`` instead, bypassing Pydantic
+                and the result cache (default: False)
         
         Returns:
             Validation result
@@ -150,6 +267,17 @@ class AsyncProofGate:
             >>> else:
             ...     print(f"Blocked: {result.reason}")
         """
+        guardrail_id = guardrail_id or self.config.guardrail_id
+        chain_id = chain_id or self.config.chain_id
+        
+        
+        store = self._cache if cache and not raw else None
+        key = (from_address, to, data, value, guardrail_id, chain_id)
+        if store is not None:
+            cached = store.get(key)
+            if cached is not None:
+                return cached
+        
         response = await self._request(
             "POST",
             "/validate",
@@ -158,11 +286,18 @@ class AsyncProofGate:
                 "to": to,
                 "data": data,
                 "value": value,
-                "guardrailId": guardrail_id or self.config.guardrail_id,
-                "chainId": chain_id or self.config.chain_id,
+                "guardrailId": guardrail_id,
+                "chainId": chain_id,
             },
         )
-        return ValidateResponse.model_validate(response)
+        if raw:
+            from proofgate.types_fast import parse_validate_fast
+            return parse_validate_fast(response)
+        result = _parse(ValidateResponse, response)
+        
+        if store is not None:
+            store[key] = result
+        return result
     
     async def validate_or_throw(
         self,
@@ -204,6 +339,7 @@ class AsyncProofGate:
             value=value,
             guardrail_id=guardrail_id,
             chain_id=chain_id,
+            cache=False,
         )
         
         if not result.safe:
@@ -215,11 +351,71 @@ class AsyncProofGate:
         
         return result
     
-    async def check_agent(self, wallet: str) -> AgentCheckResponse:
+    async def validate_many(self, requests: List[ValidateRequest]) -> List[ValidateResponse]:
+        """Validate several transactions concurrently.
+        
+        All requests are issued at once over the shared connection pool,
+        so N validations take roughly one round-trip instead of N.
+        
+        Args:
+            requests: Transactions to validate
+        
+        Returns:
+            Validation results, in the same order as ``requests``
+        
+        Example:
+            >>> results = await pg.validate_many([
+            ...     ValidateRequest(from_address=agent, to=token, data=approve),
+            ...     ValidateRequest(from_address=agent, to=router, data=swap),
+            ... ])
+            >>> 
+            >>> if all(r.safe for r in results):
+            ...     # Execute the batch
+            ...     pass
+        """
+        return list(await asyncio.gather(*(
+            self.validate(
+                from_address=r.from_address,
+                to=r.to,
+                data=r.data,
+                value=r.value,
+                guardrail_id=r.guardrail_id,
+                chain_id=r.chain_id,
+            )
+            for r in requests
+        )))
+    
+    @overload
+    async def check_agent(
+        self,
+        wallet: str,
+        raw: Literal[False] = ...,
+    ) -> AgentCheckResponse: ...
+    
+    @overload
+    async def check_agent(
+        self,
+        wallet: str,
+        raw: Literal[True],
+    ) -> "AgentCheckResponseFast": ...
+    
+    @overload
+    async def check_agent(
+        self,
+        wallet: str,
+        raw: bool = ...,
+    ) -> Union[AgentCheckResponse, "AgentCheckResponseFast"]: ...
+    
+    async def check_agent(
+        self,
+        wallet: str,
+        raw: bool = False,
+    ) -> Union[AgentCheckResponse, "AgentCheckResponseFast"]:
         """Check an agent's trust score and verification status.
         
         Args:
             wallet: Agent wallet address
+            raw: Return a msgspec ``AgentCheckResponseFast`` instead
         
         Returns:
             Agent verification info
@@ -233,13 +429,42 @@ class AsyncProofGate:
             ...     print("Warning: Unverified agent")
         """
         response = await self._request("GET", f"/agents/check?wallet={wallet}")
-        return AgentCheckResponse.model_validate(response)
+        if raw:
+            from proofgate.types_fast import parse_agent_check_fast
+            return parse_agent_check_fast(response)
+        return _parse(AgentCheckResponse, response)
+    
+    @overload
+    async def get_evidence(
+        self,
+        validation_id: str,
+        raw: Literal[False] = ...,
+    ) -> EvidenceResponse: ...
+    
+    @overload
+    async def get_evidence(
+        self,
+        validation_id: str,
+        raw: Literal[True],
+    ) -> "EvidenceResponseFast": ...
     
-    async def get_evidence(self, validation_id: str) -> EvidenceResponse:
+    @overload
+    async def get_evidence(
+        self,
+        validation_id: str,
+        raw: bool = ...,
+    ) -> Union[EvidenceResponse, "EvidenceResponseFast"]: ...
+    
+    async def get_evidence(
+        self,
+        validation_id: str,
+        raw: bool = False,
+    ) -> Union[EvidenceResponse, "EvidenceResponseFast"]:
         """Get evidence for a past validation.
         
         Args:
             validation_id: Validation ID
+            raw: Return a msgspec ``EvidenceResponseFast`` instead
         
         Returns:
             Evidence details
@@ -250,7 +475,10 @@ class AsyncProofGate:
             >>> print(evidence.result)
         """
         response = await self._request("GET", f"/evidence/{validation_id}")
-        return EvidenceResponse.model_validate(response)
+        if raw:
+            from proofgate.types_fast import parse_evidence_fast
+            return parse_evidence_fast(response)
+        return _parse(EvidenceResponse, response)
     
     async def get_usage(self, wallet: str) -> UsageResponse:
         """Get validation usage stats for a wallet.
@@ -262,7 +490,7 @@ class AsyncProofGate:
             Usage statistics
         """
         response = await self._request("GET", f"/validate?wallet={wallet}")
-        return UsageResponse.model_validate(response)
+        return _parse(UsageResponse, response)
 
 
 class ProofGate:
@@ -295,6 +523,8 @@ class ProofGate:
         chain_id: int = 8453,
         guardrail_id: Optional[str] = None,
         timeout: float = 30.0,
+        pool_size: int = 100,
+        cache_ttl: float = 0.0,
     ):
         """Initialize ProofGate client.
         
@@ -304,18 +534,13 @@ class ProofGate:
             chain_id: Default chain ID (default: 8453 for Base)
             guardrail_id: Default guardrail ID to use for validations
             timeout: Request timeout in seconds (default: 30.0)
+            pool_size: Max pooled connections; requests are multiplexed
+                over HTTP/2 (default: 100)
+            cache_ttl: Seconds to reuse validate() results for identical
+                transactions, e.g. agent retries (default: 0, disabled).
+                Cache hits skip server-side checks such as daily limits.
         """
-        if not api_key:
-            raise ProofGateError(
-                "API key is required. Get one at https://www.proofgate.xyz/dashboard",
-                "MISSING_API_KEY",
-            )
-        
-        if not api_key.startswith("pg_"):
-            raise ProofGateError(
-                'Invalid API key format. Keys start with "pg_"',
-                "INVALID_API_KEY",
-            )
+        _check_api_key(api_key)
         
         self.config = ProofGateConfig(
             api_key=api_key,
@@ -323,17 +548,30 @@ class ProofGate:
             chain_id=chain_id,
             guardrail_id=guardrail_id,
             timeout=timeout,
+            pool_size=pool_size,
+            cache_ttl=cache_ttl,
         )
         
+        limits = httpx.Limits(
+            max_connections=pool_size,
+            max_keepalive_connections=pool_size,
+        )
         self._client = httpx.Client(
             base_url=base_url,
             timeout=timeout,
+            limits=limits,
+            http2=True,
             headers={
                 "Content-Type": "application/json",
                 "X-API-Key": api_key,
             },
         )
     
+        self._cache: "Optional[TTLCache[Tuple[Any, ...], ValidateResponse]]" = (
+            TTLCache(maxsize=1024, ttl=cache_ttl) if cache_ttl > 0 else None
+        )
+        self._cache_lock = threading.Lock()
+    
     def __enter__(self) -> "ProofGate":
         return self
     
@@ -349,26 +587,67 @@ class ProofGate:
         method: str,
         path: str,
         json: Optional[Dict[str, Any]] = None,
-    ) -> Dict[str, Any]:
-        """Make an API request."""
+    ) -> bytes:
+        """Make an API request and return the raw response body."""
         try:
-            response = self._client.request(method, path, json=json)
-            data = response.json()
+            body = orjson.dumps(json) if json is not None else None
+            response = self._client.request(method, path, content=body)
             
             if not response.is_success:
+                data = orjson.loads(response.content)
                 raise ProofGateError(
                     data.get("error") or data.get("message") or f"HTTP {response.status_code}",
                     "API_ERROR",
                     response.status_code,
                 )
             
-            return data
+            return response.content
             
         except httpx.TimeoutException:
             raise ProofGateError("Request timeout", "TIMEOUT")
         except httpx.RequestError as e:
             raise ProofGateError(str(e), "NETWORK_ERROR")
     
+    @overload
+    def validate(
+        self,
+        from_address: str,
+        to: str,
+        data: str,
+        value: str = ...,
+        guardrail_id: Optional[str] = ...,
+        chain_id: Optional[int] = ...,
+        cache: bool = ...,
+        raw: Literal[False] = ...,
+    ) -> ValidateResponse: ...
+    
+    @overload
+    def validate(
+        self,
+        from_address: str,
+        to: str,
+        data: str,
+        value: str = ...,
+        guardrail_id: Optional[str] = ...,
+        chain_id: Optional[int] = ...,
+        cache: bool = ...,
+        *,
+        raw: Literal[True],
+    ) -> "ValidateResponseFast": ...
+    
+    @overload
+    def validate(
+        self,
+        from_address: str,
+        to: str,
+        data: str,
+        value: str = ...,
+        guardrail_id: Optional[str] = ...,
+        chain_id: Optional[int] = ...,
+        cache: bool = ...,
+        raw: bool = ...,
+    ) -> Union[ValidateResponse, "ValidateResponseFast"]: ...
+    
     def validate(
         self,
         from_address: str,
@@ -377,7 +656,9 @@ class ProofGate:
         value: str = "0",
         guardrail_id: Optional[str] = None,
         chain_id: Optional[int] = None,
-    ) -> ValidateResponse:
+        cache: bool = True,
+        raw: bool = False,
+    ) -> Union[ValidateResponse, "ValidateResponseFast"]:
         """Validate a transaction before execution.
         
         Args:
@@ -387,11 +668,47 @@ class ProofGate:
             value: Value in wei (default: "0")
             guardrail_id: Guardrail ID (overrides default)
             chain_id: Chain ID (overrides default)
+            cache: Use the result cache, if enabled via cache_ttl (default: True)
+            raw: Return a ``ValidateResponseFast`` instead, bypassing Pydantic
+                and the result cache (default: False)
         
         Returns:
             Validation result
         """
-        response = self._request(
+        guardrail_id = guardrail_id or self.config.guardrail_id
+        chain_id = chain_id or self.config.chain_id
+        
+        
+        store = self._cache if cache and not raw else None
+        key = (from_address, to, data, value, guardrail_id, chain_id)
+        if store is not None:
+            with self._cache_lock:
+                cached = store.get(key)
+            if cached is not None:
+                return cached
+        
+        response = self._validate_raw(from_address, to, data, value, guardrail_id, chain_id)
+        if raw:
+            from proofgate.types_fast import parse_validate_fast
+            return parse_validate_fast(response)
+        result = _parse(ValidateResponse, response)
+        
+        if store is not None:
+            with self._cache_lock:
+                store[key] = result
+        return result
+    
+    def _validate_raw(
+        self,
+        from_address: str,
+        to: str,
+        data: str,
+        value: str = "0",
+        guardrail_id: Optional[str] = None,
+        chain_id: Optional[int] = None,
+    ) -> bytes:
+        """Call /validate and return the raw response body."""
+        return self._request(
             "POST",
             "/validate",
             json={
@@ -403,7 +720,6 @@ class ProofGate:
                 "chainId": chain_id or self.config.chain_id,
             },
         )
-        return ValidateResponse.model_validate(response)
     
     def validate_or_throw(
         self,
@@ -437,6 +753,7 @@ class ProofGate:
             value=value,
             guardrail_id=guardrail_id,
             chain_id=chain_id,
+            cache=False,
         )
         
         if not result.safe:
@@ -448,29 +765,116 @@ class ProofGate:
         
         return result
     
-    def check_agent(self, wallet: str) -> AgentCheckResponse:
+    def validate_many(self, requests: List[ValidateRequest]) -> List[ValidateResponse]:
+        """Validate several transactions concurrently.
+        
+        Requests run on a thread pool sized to the connection pool, so
+        N validations take roughly one round-trip instead of N.
+        
+        Args:
+            requests: Transactions to validate
+        
+        Returns:
+            Validation results, in the same order as ``requests``
+        """
+        if not requests:
+            return []
+        
+        def run(r: ValidateRequest) -> ValidateResponse:
+            return self.validate(
+                from_address=r.from_address,
+                to=r.to,
+                data=r.data,
+                value=r.value,
+                guardrail_id=r.guardrail_id,
+                chain_id=r.chain_id,
+            )
+        
+        workers = min(self.config.pool_size, len(requests))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(run, requests))
+    
+    @overload
+    def check_agent(
+        self,
+        wallet: str,
+        raw: Literal[False] = ...,
+    ) -> AgentCheckResponse: ...
+    
+    @overload
+    def check_agent(
+        self,
+        wallet: str,
+        raw: Literal[True],
+    ) -> "AgentCheckResponseFast": ...
+    
+    @overload
+    def check_agent(
+        self,
+        wallet: str,
+        raw: bool = ...,
+    ) -> Union[AgentCheckResponse, "AgentCheckResponseFast"]: ...
+    
+    def check_agent(
+        self,
+        wallet: str,
+        raw: bool = False,
+    ) -> Union[AgentCheckResponse, "AgentCheckResponseFast"]:
         """Check an agent's trust score and verification status.
         
         Args:
             wallet: Agent wallet address
+            raw: Return a msgspec ``AgentCheckResponseFast`` instead
         
         Returns:
             Agent verification info
         """
         response = self._request("GET", f"/agents/check?wallet={wallet}")
-        return AgentCheckResponse.model_validate(response)
+        if raw:
+            from proofgate.types_fast import parse_agent_check_fast
+            return parse_agent_check_fast(response)
+        return _parse(AgentCheckResponse, response)
     
-    def get_evidence(self, validation_id: str) -> EvidenceResponse:
+    @overload
+    def get_evidence(
+        self,
+        validation_id: str,
+        raw: Literal[False] = ...,
+    ) -> EvidenceResponse: ...
+    
+    @overload
+    def get_evidence(
+        self,
+        validation_id: str,
+        raw: Literal[True],
+    ) -> "EvidenceResponseFast": ...
+    
+    @overload
+    def get_evidence(
+        self,
+        validation_id: str,
+        raw: bool = ...,
+    ) -> Union[EvidenceResponse, "EvidenceResponseFast"]: ...
+    
+    def get_evidence(
+        self,
+        validation_id: str,
+        raw: bool = False,
+    ) -> Union[EvidenceResponse, "EvidenceResponseFast"]:
         """Get evidence for a past validation.
         
         Args:
             validation_id: Validation ID
+            raw: Return a msgspec ``EvidenceResponseFast`` instead
         
         Returns:
             Evidence details
         """
         response = self._request("GET", f"/evidence/{validation_id}")
-        return EvidenceResponse.model_validate(response)
+        if raw:
+            from proofgate.types_fast import parse_evidence_fast
+            return parse_evidence_fast(response)
+        return _parse(EvidenceResponse, response)
     
     def get_usage(self, wallet: str) -> UsageResponse:
         """Get validation usage stats for a wallet.
@@ -482,7 +886,7 @@ class ProofGate:
             Usage statistics
         """
         response = self._request("GET", f"/validate?wallet={wallet}")
-        return UsageResponse.model_validate(response)
+        return _parse(UsageResponse, response)
 
 
 def is_transaction_safe(
@@ -514,11 +918,36 @@ def is_transaction_safe(
         ...     data=calldata,
         ... )
     """
-    with ProofGate(api_key=api_key) as pg:
-        result = pg.validate(
-            from_address=from_address,
-            to=to,
-            data=data,
-            value=value,
-        )
-        return result.safe
+    # Only the verdict is needed, so skip building a ValidateResponse.
+    # Anything but a JSON true (e.g. the string "false") counts as unsafe.
+    response = _get_shared_client(api_key)._validate_raw(
+        from_address=from_address,
+        to=to,
+        data=data,
+        value=value,
+    )
+    return orjson.loads(response).get("safe") is True
+
+
+# Clients shared by helper functions, keyed by API key, so repeated calls
+# reuse one connection pool (and its TLS sessions) instead of reconnecting.
+_shared_clients: Dict[str, ProofGate] = {}
+_shared_clients_lock = threading.Lock()
+
+
+@atexit.register
+def _close_shared_clients() -> None:
+    """Close shared clients at interpreter exit."""
+    with _shared_clients_lock:
+        for client in _shared_clients.values():
+            client.close()
+        _shared_clients.clear()
+
+
+def _get_shared_client(api_key: str) -> ProofGate:
+    """Return the shared client for an API key, creating it on first use."""
+    with _shared_clients_lock:
+        client = _shared_clients.get(api_key)
+        if client is None:
+            client = _shared_clients[api_key] = ProofGate(api_key=api_key)
+        return client
@@ -1,7 +1,53 @@
 """Type definitions for ProofGate SDK."""
 
-from typing import Optional, List, Literal
-from pydantic import BaseModel, Field
+import os
+import sys
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Tuple, Union
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
+from typing_extensions import Annotated
+
+if TYPE_CHECKING:
+    from proofgate.types_fast import ValidateResponseFast
+
+
+ValidationStatus = Literal["PASS", "FAIL", "PENDING"]
+VerificationStatus = Literal["verified", "registered", "unverified", "unknown"]
+TrustTier = Literal["diamond", "gold", "silver", "bronze", "unverified"]
+Severity = Literal["info", "warning", "critical"]
+
+TrustScore = Annotated[int, Field(ge=0, le=100)]
+ChainId = Annotated[int, Field(ge=1, le=4503599627370476)]  # EIP-2294
+Address = Annotated[str, Field(pattern=r"^0x[0-9a-fA-F]{40}$", min_length=42, max_length=42)]
+
+# Enum-like wire values, interned so the strings consumers compare against
+# (e.g. ``result == "PASS"``) are usually the same object as the constant.
+_INTERN = {
+    s: sys.intern(s)
+    for s in (
+        "PASS", "FAIL", "PENDING",
+        "info", "warning", "critical",
+        "verified", "registered", "unverified", "unknown",
+        "diamond", "gold", "silver", "bronze",
+        "free", "pro", "local", "evidence-service",
+    )
+}
+
+
+def _to_camel(name: str) -> str:
+    """Convert a snake_case field name to its camelCase wire alias."""
+    first, *rest = name.split("_")
+    return first + "".join(part.title() for part in rest)
+
+
+# Wire keys that don't follow the camelCase rule
+_ALIASES = {
+    "from_address": "from",
+}
+
+
+def _alias(name: str) -> str:
+    """Return the wire key for a field name."""
+    return _ALIASES.get(name) or _to_camel(name)
 
 
 class ProofGateConfig(BaseModel):
@@ -12,128 +58,190 @@ class ProofGateConfig(BaseModel):
         default="https://www.proofgate.xyz/api",
         description="Base URL for API"
     )
-    chain_id: int = Field(default=8453, description="Default chain ID (8453 = Base)")
+    chain_id: ChainId = Field(default=8453, description="Default chain ID (8453 = Base)")
     guardrail_id: Optional[str] = Field(
         default=None,
         description="Default guardrail ID to use for validations"
     )
-    timeout: float = Field(default=30.0, description="Request timeout in seconds")
+    timeout: Annotated[float, Field(gt=0)] = Field(
+        default=30.0, description="Request timeout in seconds"
+    )
+    pool_size: Annotated[int, Field(ge=1)] = Field(
+        default=100, description="Max pooled HTTP connections"
+    )
+    cache_ttl: float = Field(
+        default=0.0,
+        description="Seconds to reuse validate() results for identical transactions (0 = off)"
+    )
 
 
-class ValidateRequest(BaseModel):
-    """Request for transaction validation."""
+class _WireModel(BaseModel):
+    """Base for API wire models: camelCase aliases, also populated by name.
+    
+    Instances are immutable.
+    """
+    
+    model_config = ConfigDict(
+        alias_generator=_alias,
+        populate_by_name=True,
+        extra="ignore",
+        frozen=True,
+    )
+    
+    # Literal fields already come back as the interned constants; this
+    # covers plain-str fields with enum-like values.
+    @field_validator("tier", "backend", mode="after", check_fields=False)
+    @classmethod
+    def _intern_value(cls, value: str) -> str:
+        return _INTERN.get(value, value)
+
+
+class _TxFields(_WireModel):
+    """Transaction fields shared by validation requests and evidence."""
     
-    from_address: str = Field(..., alias="from", description="Sender address (your agent's wallet)")
-    to: str = Field(..., description="Target contract address")
+    from_address: Address = Field(..., description="Sender address (your agent's wallet)")
+    to: Address = Field(..., description="Target contract address")
     data: str = Field(..., description="Transaction calldata")
     value: str = Field(default="0", description="Value in wei")
+
+
+class ValidateRequest(_TxFields):
+    """Request for transaction validation."""
+    
     guardrail_id: Optional[str] = Field(default=None, description="Guardrail ID (overrides default)")
-    chain_id: Optional[int] = Field(default=None, description="Chain ID (overrides default)")
+    chain_id: Optional[ChainId] = Field(default=None, description="Chain ID (overrides default)")
 
-    class Config:
-        populate_by_name = True
+    def to_wire(self) -> bytes:
+        """Serialize to the JSON body expected by /validate."""
+        return self.__pydantic_serializer__.to_json(self, by_alias=True)
 
 
-class ValidationCheck(BaseModel):
+class ValidationCheck(_WireModel):
     """Individual check result from validation."""
     
     name: str = Field(..., description="Check name (e.g., 'allowed_contracts', 'daily_limit')")
     passed: bool = Field(..., description="Did this check pass?")
     details: str = Field(..., description="Human-readable details")
-    severity: Literal["info", "warning", "critical"] = Field(
-        ..., description="Severity level"
-    )
+    severity: Severity = Field(..., description="Severity level")
 
 
-class ValidateResponse(BaseModel):
+class ValidateResponse(_WireModel):
     """Response from transaction validation."""
     
-    validation_id: str = Field(..., alias="validationId", description="Unique validation ID")
-    result: Literal["PASS", "FAIL", "PENDING"] = Field(..., description="Validation result")
+    validation_id: str = Field(..., description="Unique validation ID")
+    result: ValidationStatus = Field(..., description="Validation result")
     reason: str = Field(..., description="Human-readable reason")
-    evidence_uri: str = Field(..., alias="evidenceUri", description="Evidence URI")
+    evidence_uri: str = Field(..., description="Evidence URI")
     safe: bool = Field(..., description="Is the transaction safe to execute?")
-    checks: List[ValidationCheck] = Field(default_factory=list, description="Detailed check results")
-    chain_id: int = Field(..., alias="chainId", description="Chain ID validated on")
+    checks: Tuple[ValidationCheck, ...] = Field(
+        default_factory=tuple, description="Detailed check results"
+    )
+    chain_id: ChainId = Field(..., description="Chain ID validated on")
     authenticated: bool = Field(default=False, description="Was API key authenticated?")
     tier: str = Field(default="free", description="User tier (free/pro)")
     backend: str = Field(default="local", description="Backend used (local/evidence-service)")
     on_chain_recorded: bool = Field(
-        default=False, alias="onChainRecorded", description="Was proof recorded on-chain?"
+        default=False, description="Was proof recorded on-chain?"
     )
 
-    class Config:
-        populate_by_name = True
-
-
-class AgentStats(BaseModel):
+    @classmethod
+    def from_response_bytes(cls, raw: bytes) -> "ValidateResponse":
+        """Parse and validate a raw JSON API response in a single pass.
+        
+        Preferred over ``ValidateResponse(**json.loads(raw))``, which parses twice.
+        """
+        return cls.model_validate_json(raw)
+
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "ValidateResponse":
+        """Build from an already-decoded API response.
+        
+        Runs normal validation: pydantic-core is faster here than
+        constructing the model field by field without it.
+        """
+        return cls.model_validate(data)
+
+    def as_fast(self) -> "ValidateResponseFast":
+        """Copy into a lightweight ``ValidateResponseFast`` (see ``proofgate.types_fast``)."""
+        from proofgate.types_fast import ValidateResponseFast, ValidationCheckFast
+        
+        checks = [ValidationCheckFast(**dict(check)) for check in self.checks]
+        return ValidateResponseFast(**dict(self, checks=checks))
+
+
+class AgentStats(_WireModel):
     """Validation statistics for an agent."""
     
-    total_validations: int = Field(..., alias="totalValidations")
-    passed_validations: int = Field(..., alias="passedValidations")
-    failed_validations: int = Field(..., alias="failedValidations")
-    pass_rate: float = Field(..., alias="passRate")
-
-    class Config:
-        populate_by_name = True
+    total_validations: int
+    passed_validations: int
+    failed_validations: int
+    pass_rate: float
 
 
-class AgentRegistration(BaseModel):
+class AgentRegistration(_WireModel):
     """Registration info for an agent."""
     
-    name: Optional[str] = None
-    registered_at: str = Field(..., alias="registeredAt")
-
-    class Config:
-        populate_by_name = True
+    name: Any = None
+    registered_at: str
 
 
-class AgentCheckResponse(BaseModel):
+class AgentCheckResponse(_WireModel):
     """Response from agent check."""
     
-    wallet: str = Field(..., description="Wallet address (lowercase)")
-    is_registered: bool = Field(..., alias="isRegistered", description="Is this agent registered?")
-    verification_status: Literal["verified", "registered", "unverified", "unknown"] = Field(
-        ..., alias="verificationStatus", description="Verification status"
-    )
-    verification_message: str = Field(..., alias="verificationMessage", description="Human-readable message")
-    trust_score: int = Field(..., alias="trustScore", description="Trust score (0-100)")
-    tier: Literal["diamond", "gold", "silver", "bronze", "unverified"] = Field(
-        ..., description="Trust tier"
-    )
-    tier_emoji: str = Field(..., alias="tierEmoji", description="Tier emoji")
-    tier_name: str = Field(..., alias="tierName", description="Tier display name")
+    wallet: Address = Field(..., description="Wallet address (lowercase)")
+    is_registered: bool = Field(..., description="Is this agent registered?")
+    verification_status: VerificationStatus = Field(..., description="Verification status")
+    verification_message: str = Field(..., description="Human-readable message")
+    trust_score: TrustScore = Field(..., description="Trust score (0-100)")
+    tier: TrustTier = Field(..., description="Trust tier")
+    tier_emoji: str = Field(..., description="Tier emoji")
+    tier_name: str = Field(..., description="Tier display name")
     stats: AgentStats = Field(..., description="Validation statistics")
     registration: Optional[AgentRegistration] = Field(
         default=None, description="Registration info (if registered)"
     )
     recommendation: str = Field(..., description="Safety recommendation")
 
-    class Config:
-        populate_by_name = True
+    @classmethod
+    def from_response_bytes(cls, raw: bytes) -> "AgentCheckResponse":
+        """Parse and validate a raw JSON API response in a single pass.
+        
+        Preferred over ``AgentCheckResponse(**json.loads(raw))``, which parses twice.
+        """
+        return cls.model_validate_json(raw)
 
 
-class EvidenceTransaction(BaseModel):
+class EvidenceTransaction(_TxFields):
     """Transaction details in evidence."""
-    
-    from_address: str = Field(..., alias="from")
-    to: str
-    data: str
-    value: str
-
-    class Config:
-        populate_by_name = True
 
 
-class EvidenceResult(BaseModel):
+class EvidenceResult(_WireModel):
     """Validation result in evidence."""
     
-    status: Literal["PASS", "FAIL", "PENDING"]
+    status: ValidationStatus
     reason: str
     safe: bool
 
 
-class EvidenceAgent(BaseModel):
+class PassEvidenceResult(EvidenceResult):
+    """Evidence result for a passed validation."""
+    
+    status: Literal["PASS"]
+
+
+class FailEvidenceResult(EvidenceResult):
+    """Evidence result for a failed validation."""
+    
+    status: Literal["FAIL"]
+
+
+class PendingEvidenceResult(EvidenceResult):
+    """Evidence result for a validation that is still pending."""
+    
+    status: Literal["PENDING"]
+
+
+class EvidenceAgent(_WireModel):
     """Agent info in evidence."""
     
     wallet: str
@@ -141,32 +249,37 @@ class EvidenceAgent(BaseModel):
     verified: bool
 
 
-class EvidenceProof(BaseModel):
+class EvidenceProof(_WireModel):
     """Proof metadata in evidence."""
     
     authenticated: bool
-    on_chain_recorded: bool = Field(..., alias="onChainRecorded")
-    batch_id: Optional[str] = Field(default=None, alias="batchId")
-    recorded_at: Optional[str] = Field(default=None, alias="recordedAt")
-
-    class Config:
-        populate_by_name = True
+    on_chain_recorded: bool
+    batch_id: Any = None
+    recorded_at: Any = None
 
 
-class EvidenceResponse(BaseModel):
+class EvidenceResponse(_WireModel):
     """Response from evidence retrieval."""
     
-    validation_id: str = Field(..., alias="validationId", description="Validation ID")
+    validation_id: str = Field(..., description="Validation ID")
     timestamp: str = Field(..., description="Timestamp")
-    chain_id: int = Field(..., alias="chainId", description="Chain ID")
+    chain_id: ChainId = Field(..., description="Chain ID")
     transaction: EvidenceTransaction = Field(..., description="Transaction details")
-    result: EvidenceResult = Field(..., description="Validation result")
-    guardrail_id: Optional[str] = Field(default=None, alias="guardrailId", description="Guardrail used")
+    result: Annotated[
+        Union[PassEvidenceResult, FailEvidenceResult, PendingEvidenceResult],
+        Field(discriminator="status"),
+    ] = Field(..., description="Validation result")
+    guardrail_id: Optional[str] = Field(default=None, description="Guardrail used")
     agent: EvidenceAgent = Field(..., description="Agent info")
     proof: EvidenceProof = Field(..., description="Proof metadata")
 
-    class Config:
-        populate_by_name = True
+    @classmethod
+    def from_response_bytes(cls, raw: bytes) -> "EvidenceResponse":
+        """Parse and validate a raw JSON API response in a single pass.
+        
+        Preferred over ``EvidenceResponse(**json.loads(raw))``, which parses twice.
+        """
+        return cls.model_validate_json(raw)
 
 
 class UsageResponse(BaseModel):
@@ -177,3 +290,86 @@ class UsageResponse(BaseModel):
     validations_used: int
     validations_limit: int
     daily_spent_wei: str
+
+
+# Validators are normally built at class creation, but a model with an
+# unresolved forward reference defers that to its first use. Rebuild
+# everything here so any such gap fails (or is paid for) at import time,
+# never on the first API call.
+_WIRE_MODELS = (
+    ValidateRequest,
+    ValidationCheck,
+    ValidateResponse,
+    AgentStats,
+    AgentRegistration,
+    AgentCheckResponse,
+    EvidenceTransaction,
+    EvidenceResult,
+    PassEvidenceResult,
+    FailEvidenceResult,
+    PendingEvidenceResult,
+    EvidenceAgent,
+    EvidenceProof,
+    EvidenceResponse,
+    UsageResponse,
+)
+
+# Field descriptions only feed JSON schema generation, which the SDK never
+# needs at runtime. Drop them before the rebuild so the compiled schemas
+# don't keep them alive; set PROOFGATE_KEEP_DOCS=1 to retain them.
+_STRIP_DOCS = not os.environ.get("PROOFGATE_KEEP_DOCS")
+if _STRIP_DOCS:
+    for _model in _WIRE_MODELS:
+        for _field in _model.model_fields.values():
+            _field.description = None
+    del _field
+for _model in _WIRE_MODELS:
+    _model.model_rebuild(force=_STRIP_DOCS)
+    _model.__pydantic_validator__
+del _model
+
+
+def construct_validate_response(data: Dict[str, Any]) -> ValidateResponse:
+    """Build a ValidateResponse from already-decoded API data."""
+    return ValidateResponse.from_trusted(data)
+
+
+# Module-level adapters, so each compiled validator is built once and reused
+_CHECKS_ADAPTER = TypeAdapter(List[ValidationCheck])
+_VALIDATE_RESP_ADAPTER = TypeAdapter(ValidateResponse)
+_AGENT_CHECK_RESP_ADAPTER = TypeAdapter(AgentCheckResponse)
+_EVIDENCE_RESP_ADAPTER = TypeAdapter(EvidenceResponse)
+_USAGE_RESP_ADAPTER = TypeAdapter(UsageResponse)
+
+
+def parse_validation_checks(raw: bytes) -> List[ValidationCheck]:
+    """Validate a JSON list of checks in a single pass."""
+    return _CHECKS_ADAPTER.validate_json(raw)
+
+
+def parse_validate_response(raw: bytes) -> ValidateResponse:
+    """Validate a JSON /validate response in a single pass."""
+    return _VALIDATE_RESP_ADAPTER.validate_json(raw)
+
+
+def parse_agent_check_response(raw: bytes) -> AgentCheckResponse:
+    """Validate a JSON /agents/check response in a single pass."""
+    return _AGENT_CHECK_RESP_ADAPTER.validate_json(raw)
+
+
+def parse_evidence_response(raw: bytes) -> EvidenceResponse:
+    """Validate a JSON /evidence response in a single pass."""
+    return _EVIDENCE_RESP_ADAPTER.validate_json(raw)
+
+
+def parse_usage_response(raw: bytes) -> UsageResponse:
+    """Validate a JSON usage response in a single pass."""
+    return _USAGE_RESP_ADAPTER.validate_json(raw)
+
+
+_VALIDATE_REQUEST_SERIALIZER = ValidateRequest.__pydantic_serializer__
+
+
+def serialize_validate_request(request: ValidateRequest) -> bytes:
+    """Serialize a ValidateRequest to its /validate JSON body."""
+    return _VALIDATE_REQUEST_SERIALIZER.to_json(request, by_alias=True)
@@ -0,0 +1,38 @@
+"""Lightweight mirrors of hot-path response types.
+
+Returned by client methods called with ``raw=True``. With the optional
+msgspec dependency installed::
+
+    pip install "proofgate[performance]"
+
+these are frozen msgspec structs decoded in a single C-level pass, with
+type checks. Without it, ``/validate`` responses fall back to frozen,
+slotted dataclasses filled straight from ``orjson.loads`` without type
+checks, and the agent check and evidence parsers raise ImportError.
+"""
+
+try:
+    from proofgate._types_msgspec import (  # noqa: F401
+        AgentCheckResponseFast,
+        AgentRegistrationFast,
+        AgentStatsFast,
+        EvidenceAgentFast,
+        EvidenceProofFast,
+        EvidenceResponseFast,
+        EvidenceResultFast,
+        EvidenceTransactionFast,
+        ValidateResponseFast,
+        ValidationCheckFast,
+        parse_agent_check_fast,
+        parse_evidence_fast,
+        parse_validate_fast,
+    )
+except ImportError:
+    # Typed against the msgspec definitions above
+    from proofgate._types_dataclass import (  # type: ignore[assignment]  # noqa: F401
+        ValidateResponseFast,
+        ValidationCheckFast,
+        parse_agent_check_fast,
+        parse_evidence_fast,
+        parse_validate_fast,
+    )
@@ -0,0 +1,125 @@
+"""Tests for the ProofGate clients against a mocked API."""
+
+import time
+
+import httpx
+import orjson
+import pytest
+
+from proofgate import AsyncProofGate, ProofGate, ValidateRequest
+
+API = "https://www.proofgate.xyz/api"
+AGENT = "0x" + "a" * 40
+
+
+def validate_body(validation_id="val_abc123", safe=True):
+    return {
+        "validationId": validation_id,
+        "result": "PASS" if safe else "FAIL",
+        "reason": "ok" if safe else "blocked",
+        "evidenceUri": f"{API}/evidence/{validation_id}",
+        "safe": safe,
+        "chainId": 8453,
+        "checks": [{"name": "approval", "passed": safe, "details": "d", "severity": "info"}],
+    }
+
+
+def echo_target(request):
+    """Respond with a validation ID derived from the request's target."""
+    to = orjson.loads(request.content)["to"]
+    # Answer later requests first, so ordering can't come from arrival order
+    time.sleep(0.01 * (int(to[-1], 16) % 4))
+    return httpx.Response(200, json=validate_body(f"val_{to[-4:]}"))
+
+
+def targets(n):
+    return ["0x" + f"{i:040x}" for i in range(n)]
+
+
+class TestValidateCache:
+    def test_disabled_by_default(self, httpx_mock):
+        httpx_mock.add_response(url=f"{API}/validate", json=validate_body(), is_reusable=True)
+        pg = ProofGate(api_key="pg_test")
+
+        pg.validate(AGENT, "0x1", "0x")
+        pg.validate(AGENT, "0x1", "0x")
+
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_hit_reuses_result(self, httpx_mock):
+        httpx_mock.add_response(url=f"{API}/validate", json=validate_body(), is_reusable=True)
+        pg = ProofGate(api_key="pg_test", cache_ttl=60)
+
+        first = pg.validate(AGENT, "0x1", "0x")
+        second = pg.validate(AGENT, "0x1", "0x")
+
+        assert second is first
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_miss_on_different_calldata(self, httpx_mock):
+        httpx_mock.add_response(url=f"{API}/validate", json=validate_body(), is_reusable=True)
+        pg = ProofGate(api_key="pg_test", cache_ttl=60)
+
+        pg.validate(AGENT, "0x1", "0xa9059cbb00")
+        pg.validate(AGENT, "0x1", "0xa9059cbb01")
+
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_cache_false_bypasses(self, httpx_mock):
+        httpx_mock.add_response(url=f"{API}/validate", json=validate_body(), is_reusable=True)
+        pg = ProofGate(api_key="pg_test", cache_ttl=60)
+
+        pg.validate(AGENT, "0x1", "0x")
+        pg.validate(AGENT, "0x1", "0x", cache=False)
+        pg.validate_or_throw(AGENT, "0x1", "0x")
+
+        assert len(httpx_mock.get_requests()) == 3
+
+    def test_raw_bypasses(self, httpx_mock):
+        pytest.importorskip("msgspec")
+        httpx_mock.add_response(url=f"{API}/validate", json=validate_body(), is_reusable=True)
+        pg = ProofGate(api_key="pg_test", cache_ttl=60)
+
+        full = pg.validate(AGENT, "0x1", "0x")
+        fast = pg.validate(AGENT, "0x1", "0x", raw=True)
+
+        assert fast is not full
+        assert fast.safe is True
+        assert len(httpx_mock.get_requests()) == 2
+
+    @pytest.mark.asyncio
+    async def test_async_hit_reuses_result(self, httpx_mock):
+        httpx_mock.add_response(url=f"{API}/validate", json=validate_body(), is_reusable=True)
+        async with AsyncProofGate(api_key="pg_test", cache_ttl=60) as pg:
+            first = await pg.validate(AGENT, "0x1", "0x")
+            second = await pg.validate(AGENT, "0x1", "0x")
+
+        assert second is first
+        assert len(httpx_mock.get_requests()) == 1
+
+
+class TestValidateMany:
+    def test_results_follow_request_order(self, httpx_mock):
+        httpx_mock.add_callback(echo_target, url=f"{API}/validate", is_reusable=True)
+        pg = ProofGate(api_key="pg_test")
+        tos = targets(8)
+
+        results = pg.validate_many(
+            [ValidateRequest(from_address=AGENT, to=to, data="0x") for to in tos]
+        )
+
+        assert [r.validation_id for r in results] == [f"val_{to[-4:]}" for to in tos]
+
+    def test_empty(self, httpx_mock):
+        assert ProofGate(api_key="pg_test").validate_many([]) == []
+
+    @pytest.mark.asyncio
+    async def test_async_results_follow_request_order(self, httpx_mock):
+        httpx_mock.add_callback(echo_target, url=f"{API}/validate", is_reusable=True)
+        tos = targets(8)
+        async with AsyncProofGate(api_key="pg_test") as pg:
+            results = await pg.validate_many(
+                [ValidateRequest(from_address=AGENT, to=to, data="0x") for to in tos]
+            )
+
+        assert [r.validation_id for r in results] == [f"val_{to[-4:]}" for to in tos]
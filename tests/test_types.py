@@ -0,0 +1,122 @@
+"""Tests for response model parsing."""
+
+import orjson
+import pytest
+from pydantic import ValidationError
+
+from proofgate.types import (
+    FailEvidenceResult,
+    PassEvidenceResult,
+    PendingEvidenceResult,
+    ValidateResponse,
+    ValidationCheck,
+    parse_agent_check_response,
+    parse_evidence_response,
+    parse_validate_response,
+)
+
+WALLET = "0x" + "a" * 40
+
+VALIDATE = {
+    "validationId": "val_abc123",
+    "result": "PASS",
+    "reason": "All checks passed",
+    "evidenceUri": "https://www.proofgate.xyz/evidence/val_abc123",
+    "safe": True,
+    "chainId": 8453,
+    "checks": [
+        {"name": "approval", "passed": True, "details": "ok", "severity": "info"},
+        {"name": "slippage", "passed": True, "details": "ok", "severity": "warning"},
+    ],
+}
+
+AGENT = {
+    "wallet": WALLET,
+    "isRegistered": True,
+    "verificationStatus": "verified",
+    "verificationMessage": "Verified agent",
+    "trustScore": 80,
+    "tier": "gold",
+    "tierEmoji": "🥇",
+    "tierName": "Gold",
+    "stats": {
+        "totalValidations": 10,
+        "passedValidations": 9,
+        "failedValidations": 1,
+        "passRate": 0.9,
+    },
+    "registration": {"name": "agent", "registeredAt": "2026-01-01T00:00:00Z"},
+    "recommendation": "Trusted",
+}
+
+
+def evidence(status):
+    return {
+        "validationId": "val_abc123",
+        "timestamp": "2026-01-01T00:00:00Z",
+        "chainId": 8453,
+        "transaction": {"from": WALLET, "to": "0x" + "b" * 40, "data": "0x", "value": "0"},
+        "result": {"status": status, "reason": "r", "safe": status == "PASS"},
+        "agent": {"wallet": WALLET, "verified": True},
+        "proof": {"authenticated": True, "onChainRecorded": False},
+    }
+
+
+def test_checks_are_an_immutable_tuple():
+    result = parse_validate_response(orjson.dumps(VALIDATE))
+
+    assert isinstance(result.checks, tuple)
+    assert all(isinstance(c, ValidationCheck) for c in result.checks)
+    assert [c.name for c in result.checks] == ["approval", "slippage"]
+    assert hash(result) == hash(parse_validate_response(orjson.dumps(VALIDATE)))
+
+
+def test_missing_checks_default_to_empty_tuple():
+    data = {k: v for k, v in VALIDATE.items() if k != "checks"}
+
+    assert parse_validate_response(orjson.dumps(data)).checks == ()
+
+
+def test_from_trusted_matches_json_parsing():
+    assert ValidateResponse.from_trusted(VALIDATE) == parse_validate_response(
+        orjson.dumps(VALIDATE)
+    )
+
+
+def test_safe_is_coerced_not_passed_through():
+    result = parse_validate_response(orjson.dumps({**VALIDATE, "safe": "false"}))
+
+    assert result.safe is False
+
+
+def test_nested_models_are_built():
+    result = parse_agent_check_response(orjson.dumps(AGENT))
+
+    assert result.stats.pass_rate == 0.9
+    assert result.registration is not None
+    assert result.registration.registered_at == "2026-01-01T00:00:00Z"
+
+
+def test_malformed_wallet_is_rejected():
+    with pytest.raises(ValidationError):
+        parse_agent_check_response(orjson.dumps({**AGENT, "wallet": "0xabc"}))
+
+
+@pytest.mark.parametrize(
+    "status, model",
+    [
+        ("PASS", PassEvidenceResult),
+        ("FAIL", FailEvidenceResult),
+        ("PENDING", PendingEvidenceResult),
+    ],
+)
+def test_evidence_result_picks_tagged_member(status, model):
+    result = parse_evidence_response(orjson.dumps(evidence(status)))
+
+    assert type(result.result) is model
+    assert result.transaction.from_address == WALLET
+
+
+def test_unknown_evidence_status_is_rejected():
+    with pytest.raises(ValidationError):
+        parse_evidence_response(orjson.dumps(evidence("UNKNOWN")))